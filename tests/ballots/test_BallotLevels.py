@@ -54,6 +54,11 @@ def test_empty_ballot():
     assert repr(ballot.scale) == 'Scale()'
 
 
+def test_restrict_to_superset():
+    ballot = BallotLevels({'a': 10, 'b': 7}, candidates={'a', 'b', 'c'})
+    assert ballot.restrict(candidates={'a', 'b', 'c', 'd'}) is ballot
+
+
 def test_type_error():
     ballot = BallotLevels({'a': 10, 'b': 7, 'c': 0})
     with pytest.raises(TypeError):
@@ -40,6 +40,10 @@ class Ballot:
     what the ballot clearly indicated.
     """
 
+    # No instance attribute at this level: this allows subclasses that declare ``__slots__`` to actually drop the
+    # per-instance ``__dict__`` (one ballot is created per voter, so this adds up at profile scale).
+    __slots__ = ()
+
     @property
     def candidates(self) -> NiceSet:
         """NiceSet: The candidates that were available at the moment when the voter cast her ballot. As a consequence,
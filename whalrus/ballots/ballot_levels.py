@@ -65,6 +65,8 @@ class BallotLevels(BallotOrder):
         10
     """
 
+    __slots__ = ('scale',)
+
     # Core features: ballot and candidates
     # ====================================
 
@@ -98,8 +100,10 @@ class BallotLevels(BallotOrder):
 
     @cached_property
     def as_weak_order(self) -> list:
-        return [NiceSet(k for k in self.as_dict.keys() if self.as_dict[k] == v)
-                for v in sorted(set(self.as_dict.values()), reverse=True)]
+        groups = dict()
+        for c, v in self.as_dict.items():
+            groups.setdefault(v, set()).add(c)
+        return [NiceSet(groups[v]) for v in sorted(groups.keys(), reverse=True)]
 
     @cached_property
     def candidates_in_b(self) -> NiceSet:
@@ -107,16 +111,22 @@ class BallotLevels(BallotOrder):
 
     @cached_property
     def is_numeric(self):
-        return all([isinstance(v, numbers.Number) for k, v in self.items()])
+        return all(isinstance(v, numbers.Number) for v in self.values())
 
     # Representation
     # ==============
 
-    def __repr__(self) -> str:
+    @cached_property
+    def _repr(self) -> str:
+        # The ballot is immutable, so the string (which involves sorting the dict and the candidates) is computed
+        # only once.
         return 'BallotLevels(%s, candidates=%s, scale=%s)' % (
             self.as_dict, self.candidates, repr(self.scale)
         )
 
+    def __repr__(self) -> str:
+        return self._repr
+
     def __str__(self) -> str:
         return ', '.join([str(k) + ': ' + str(v) for k, v in dict_to_items(self.as_dict)])
 
@@ -128,6 +138,9 @@ class BallotLevels(BallotOrder):
             raise TypeError("restrict() got an unexpected keyword argument %r" % list(kwargs.keys())[0])
         if candidates is None:
             return self
+        if self.candidates_in_b <= candidates and self.candidates <= candidates:
+            # The restriction would change nothing: avoid rebuilding a ballot.
+            return self
         return BallotLevels({k: v for k, v in self.as_dict.items() if k in candidates},
                             candidates=NiceSet(self.candidates & candidates), scale=self.scale)
 
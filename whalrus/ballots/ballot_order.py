@@ -75,6 +75,8 @@ class BallotOrder(Ballot):
         c
     """
 
+    __slots__ = ('_internal_representation', '_input_candidates', '_cached_properties')
+
     # Core features: ballot and candidates
     # ====================================
 
@@ -148,6 +150,10 @@ class BallotOrder(Ballot):
         """
         if self._input_candidates is None:
             return self.candidates_in_b
+        if type(self._input_candidates) is NiceSet:
+            # Share the set object instead of copying it: within a profile, many ballots are typically built on the
+            # same candidate set, and it is never mutated.
+            return self._input_candidates
         return NiceSet(self._input_candidates)
 
     # Misc
@@ -409,7 +415,7 @@ class BallotOrder(Ballot):
             >>> BallotOrder('a ~ b > c').is_strict
             False
         """
-        return all([len(s) == 1 for s in self.as_weak_order])
+        return all(len(s) == 1 for s in self.as_weak_order)
 
     def _check_strict(self) -> None:
         """
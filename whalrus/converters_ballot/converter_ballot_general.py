@@ -93,8 +93,22 @@ class ConverterBallotGeneral(ConverterBallot):
         self.plurality_priority = plurality_priority
         self.veto_priority = veto_priority
         self.one_name_priority = one_name_priority
+        # Dispatch table on the exact type of the input. An exact type match replaces the whole isinstance chain with
+        # one dict lookup; inputs of other (sub)classes fall back to the chain below.
+        self._dispatch = {
+            BallotOrder: lambda b, c: b if c is None else b.restrict(c),
+            BallotLevels: lambda b, c: b if c is None else b.restrict(c),
+            BallotPlurality: lambda b, c: b if c is None else b.restrict(
+                candidates=c, priority=self.plurality_priority),
+            BallotVeto: lambda b, c: b if c is None else b.restrict(candidates=c, priority=self.veto_priority),
+            BallotOneName: lambda b, c: b if c is None else b.restrict(candidates=c, priority=self.one_name_priority),
+            dict: lambda b, c: self(BallotLevels(b), c),
+        }
 
     def __call__(self, x: object, candidates: set=None) -> Ballot:
+        handler = self._dispatch.get(type(x))
+        if handler is not None:
+            return handler(x, candidates)
         # If it is a ballot, deal with the restriction to the candidates.
         if isinstance(x, Ballot):
             if candidates is None:
@@ -108,15 +122,23 @@ class ConverterBallotGeneral(ConverterBallot):
             if isinstance(x, BallotOneName):
                 return x.restrict(candidates=candidates, priority=self.one_name_priority)
             raise NotImplementedError('Unable to restrict the candidates for ballot of class %s.' % x.__class__)
-        # If it is not a ballot, convert to ballot and call the method again.
+        # If it is not a ballot, convert to ballot and call the method again. Only strings need the weak-order parser
+        # and only lists can describe an order otherwise: any other input is a name, i.e. a single candidate. This
+        # avoids raising and catching exceptions just to dispatch on the type of the input.
         if isinstance(x, dict):
             return self(BallotLevels(x), candidates)
-        try:
-            ballot_order = BallotOrder(x)
-            if len(ballot_order) == 1:
+        if isinstance(x, str):
+            try:
+                ballot_order = BallotOrder(x)
+            except ParseException:
                 return self(BallotOneName(x), candidates)
-            else:
-                return self(ballot_order, candidates)
-        except (TypeError, ParseException):
-            pass
-        return self(BallotOneName(x), candidates)
+        elif isinstance(x, (list, tuple)):
+            try:
+                ballot_order = BallotOrder(x)
+            except TypeError:
+                return self(BallotOneName(x), candidates)
+        else:
+            return self(BallotOneName(x), candidates)
+        if len(ballot_order) == 1:
+            return self(BallotOneName(x), candidates)
+        return self(ballot_order, candidates)
@@ -31,6 +31,11 @@ from whalrus.converters_ballot.converter_ballot_to_levels_list_numeric import Co
 from whalrus.converters_ballot.converter_ballot_to_levels_list_non_numeric import ConverterBallotToLevelsListNonNumeric
 
 
+# Default scale, shared by all converters built without an explicit scale: it is immutable, so there is no point in
+# building one per converter.
+_DEFAULT_SCALE = ScaleInterval(low=0, high=1)
+
+
 class ConverterBallotToLevels(ConverterBallot):
     """
     Default converter to a :class:`BallotLevels` (representing grades, appreciations, etc).
@@ -73,10 +78,7 @@ class ConverterBallotToLevels(ConverterBallot):
     def __init__(self, scale: Scale = None, borda_unordered_give_points: bool = True):
         self.scale = scale
         self.borda_unordered_give_points = borda_unordered_give_points
-        if scale is None:
-            self._aux_converter = ConverterBallotToLevelsInterval(
-                scale=ScaleInterval(low=0, high=1), borda_unordered_give_points=borda_unordered_give_points)
-        elif isinstance(scale, ScaleInterval):
+        if isinstance(scale, ScaleInterval):
             self._aux_converter = ConverterBallotToLevelsInterval(
                 scale=scale, borda_unordered_give_points=borda_unordered_give_points)
         elif isinstance(scale, ScaleRange):
@@ -90,8 +92,9 @@ class ConverterBallotToLevels(ConverterBallot):
                 self._aux_converter = ConverterBallotToLevelsListNonNumeric(
                     scale=scale, borda_unordered_give_points=borda_unordered_give_points)
         else:
+            # In particular, when ``scale`` is None.
             self._aux_converter = ConverterBallotToLevelsInterval(
-                scale=ScaleInterval(low=0, high=1), borda_unordered_give_points=borda_unordered_give_points)
+                scale=_DEFAULT_SCALE, borda_unordered_give_points=borda_unordered_give_points)
 
     def __call__(self, x: object, candidates: set =None) -> BallotLevels:
         if self.scale is None and isinstance(x, BallotLevels):
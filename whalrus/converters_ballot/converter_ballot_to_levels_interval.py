@@ -35,6 +35,40 @@ from whalrus.scorers.scorer_borda import ScorerBorda
 from whalrus.utils.utils import my_division
 
 
+def _affine_levels(items, low_out, factor, low_in) -> dict:
+    """
+    Map evaluations affinely onto the target scale.
+
+    This is the numeric kernel of the conversion branches: each pair ``(c, v)`` of ``items`` is mapped to
+    ``(c, low_out + factor * (v - low_in))``. All operands stay Python numbers (typically fractions), so the
+    computation is exact.
+    """
+    return {c: low_out + factor * (v - low_in) for c, v in items}
+
+
+def _borda_scores(x: BallotOrder, unordered_give_points: bool) -> dict:
+    """
+    Borda scores of a ballot, cached on the ballot itself.
+
+    When a profile is converted, the same ballot can go through the Borda branch several times (e.g. via
+    :class:`ConverterBallotToLevelsListNonNumeric`, which relies on :class:`ConverterBallotToLevelsRange`, which relies
+    on this converter). Hence the scores are stored in the cache of the ballot, with one entry for each value of
+    ``unordered_give_points``.
+    """
+    key = 'borda_scores_unordered_give_points_%s' % unordered_give_points
+    # noinspection PyProtectedMember
+    try:
+        cache = x._cached_properties
+    except AttributeError:
+        cache = x._cached_properties = dict()
+    try:
+        return cache[key]
+    except KeyError:
+        scores = ScorerBorda(ballot=x, candidates=x.candidates, unordered_give_points=unordered_give_points).scores_
+        cache[key] = scores
+        return scores
+
+
 class ConverterBallotToLevelsInterval(ConverterBallot):
     """0
     Default converter to a :class:`BallotLevels` using a :class:`ScaleInterval` (interval of real numbers).
@@ -88,50 +122,84 @@ class ConverterBallotToLevelsInterval(ConverterBallot):
         self.low = scale.low
         self.high = scale.high
         self.borda_unordered_give_points = borda_unordered_give_points
+        self._general_converter = ConverterBallotGeneral()
 
     def __call__(self, x: object, candidates: set=None) -> BallotLevels:
-        x = ConverterBallotGeneral()(x, candidates=None)
+        # Bind the hot attributes once: LOAD_FAST is much cheaper than LOAD_ATTR inside the comprehensions below.
+        low, high, scale = self.low, self.high, self.scale
+        x = self._general_converter(x, candidates=None)
         if isinstance(x, BallotVeto):
+            # Build the levels directly on the restricted candidate set: this avoids constructing a ballot on all
+            # the candidates and restricting it afterwards.
+            restricted = x.candidates if candidates is None else x.candidates & candidates
             if x.candidate is None:
-                return BallotLevels(dict(), candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
-            return BallotLevels({c: self.low if c == x.candidate else self.high for c in x.candidates},
-                                candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
+                return BallotLevels(dict(), candidates=restricted, scale=scale)
+            # All candidates share the same level, except possibly one: let dict.fromkeys fill the table in C code.
+            levels = dict.fromkeys(restricted, high)
+            if x.candidate in levels:
+                levels[x.candidate] = low
+            return BallotLevels(levels, candidates=restricted, scale=scale)
         if isinstance(x, BallotOneName):  # Including Plurality
+            restricted = x.candidates if candidates is None else x.candidates & candidates
             if x.candidate is None:
-                return BallotLevels(dict(), candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
-            return BallotLevels({c: self.high if c == x.candidate else self.low for c in x.candidates},
-                                candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
+                return BallotLevels(dict(), candidates=restricted, scale=scale)
+            levels = dict.fromkeys(restricted, low)
+            if x.candidate in levels:
+                levels[x.candidate] = high
+            return BallotLevels(levels, candidates=restricted, scale=scale)
         if isinstance(x, BallotLevels):
             if not x.scale.is_bounded:
-                if all([isinstance(v, numbers.Number) for v in x.values()]):
-                    x_min, x_max = min(x.values()), max(x.values())
-                    if x_min >= self.low and x_max <= self.high:
+                # Infer the scale in a single pass over the values, tracking the minimum, the maximum, whether all
+                # values are numbers, and the set of distinct values.
+                x_min, x_max = None, None
+                all_numeric = True
+                values = set()
+                for v in x.values():
+                    if isinstance(v, numbers.Number):
+                        if x_min is None:
+                            x_min, x_max = v, v
+                        else:
+                            if v < x_min:
+                                x_min = v
+                            if v > x_max:
+                                x_max = v
+                    else:
+                        all_numeric = False
+                    values.add(v)
+                if all_numeric and x_min is not None:
+                    if x_min >= low and x_max <= high:
                         return BallotLevels(
                             x.as_dict, candidates=x.candidates,
-                            scale=ScaleInterval(low=self.low, high=self.high)).restrict(candidates=candidates)
+                            scale=ScaleInterval(low=low, high=high)).restrict(candidates=candidates)
                     else:
                         x = BallotLevels(x.as_dict, candidates=x.candidates,
-                                         scale=ScaleInterval(low=min(x.values()), high=max(x.values())))
-                else:
-                    x = BallotLevels(x.as_dict, candidates=x.candidates, scale=ScaleFromSet(set(x.values())))
+                                         scale=ScaleInterval(low=x_min, high=x_max))
+                elif not all_numeric:
+                    x = BallotLevels(x.as_dict, candidates=x.candidates, scale=ScaleFromSet(values))
             try:  # Interpret as a cardinal ballot
+                x_low = x.scale.low
+                factor = my_division(high - low, x.scale.high - x.scale.low)
                 return BallotLevels(
-                    {c: self.low + my_division((self.high - self.low) * (v - x.scale.low), (x.scale.high - x.scale.low))
-                     for c, v in x.items()},
-                    candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
+                    _affine_levels(x.items(), low, factor, x_low),
+                    candidates=x.candidates, scale=scale).restrict(candidates=candidates)
             except (TypeError, AttributeError):
                 x_scale = x.scale
                 if isinstance(x_scale, ScaleFromList):
+                    # Resolve the level indexes and the rescale factor once, instead of once per candidate.
+                    indexes = x_scale.as_dict
+                    factor = my_division(high - low, len(x_scale.levels) - 1)
                     return BallotLevels(
-                        {c: self.low + my_division(
-                            (self.high - self.low) * x_scale.as_dict[x[c]], (len(x_scale.levels) - 1))
-                         for c, v in x.items()},
-                        candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
+                        {c: low + factor * indexes[v] for c, v in x.items()},
+                        candidates=x.candidates, scale=scale).restrict(candidates=candidates)
         if isinstance(x, BallotOrder):
-            borda = ScorerBorda(ballot=x, candidates=x.candidates,
-                                unordered_give_points=self.borda_unordered_give_points).scores_
+            borda = _borda_scores(x, unordered_give_points=self.borda_unordered_give_points)
             score_max = len(x.candidates) - 1 if self.borda_unordered_give_points else len(x.candidates_in_b) - 1
+            if x.candidates_in_b:
+                # The division is loop-invariant: perform it once and multiply inside the loop.
+                factor = my_division(high - low, score_max)
+                levels = {c: low + factor * borda[c] for c in x.candidates_in_b}
+            else:
+                levels = dict()
             return BallotLevels(
-                {c: self.low + my_division((self.high - self.low) * borda[c], score_max) for c in x.candidates_in_b},
-                candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
+                levels, candidates=x.candidates, scale=scale).restrict(candidates=candidates)
         raise NotImplementedError
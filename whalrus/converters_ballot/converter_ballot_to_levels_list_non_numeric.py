@@ -20,7 +20,7 @@ along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 from whalrus.converters_ballot.converter_ballot_general import ConverterBallotGeneral
-from whalrus.converters_ballot.converter_ballot_to_levels_range import ConverterBallotToLevelsRange
+from whalrus.converters_ballot.converter_ballot_to_levels_interval import ConverterBallotToLevelsInterval
 from whalrus.ballots.ballot_veto import BallotVeto
 from whalrus.ballots.ballot_plurality import BallotPlurality
 from whalrus.ballots.ballot_one_name import BallotOneName
@@ -76,18 +76,22 @@ class ConverterBallotToLevelsListNonNumeric(ConverterBallot):
     def __init__(self, scale: ScaleFromList, borda_unordered_give_points: bool = True):
         self.scale = scale
         self.borda_unordered_give_points = borda_unordered_give_points
+        self._general_converter = ConverterBallotGeneral()
+        # Convert directly to the interval [0, n - 1]: rounding and mapping to the levels are then done in a single
+        # pass below, instead of building an intermediate integer-range ballot.
+        self._interval_converter = ConverterBallotToLevelsInterval(
+            scale=ScaleInterval(low=0, high=len(scale.levels) - 1),
+            borda_unordered_give_points=borda_unordered_give_points)
 
     def __call__(self, x: object, candidates: set =None) -> BallotLevels:
-        x = ConverterBallotGeneral()(x, candidates=None)
-        if isinstance(x, BallotLevels) and any([level in self.scale.levels for level in x.values()]):
-            if all([level in self.scale.levels for level in x.values()]):
+        x = self._general_converter(x, candidates=None)
+        if isinstance(x, BallotLevels) and any(level in self.scale.levels for level in x.values()):
+            if all(level in self.scale.levels for level in x.values()):
                 return BallotLevels(x.as_dict, scale=self.scale)
             else:
                 # Cf. test_ConverterBallotToLevelsListNonNumeric for an explanation of this edge case.
                 logging.warning('Not all levels of ballot ``%s`` are in the scale.' % x)
-        x = ConverterBallotToLevelsRange(
-            scale=ScaleRange(low=0, high=len(self.scale.levels) - 1),
-            borda_unordered_give_points=self.borda_unordered_give_points
-        )(x, candidates=None)
-        return BallotLevels({c: self.scale.levels[v] for c, v in x.items()},
+        x = self._interval_converter(x, candidates=None)
+        levels = self.scale.levels
+        return BallotLevels({c: levels[round(v)] for c, v in x.items()},
                             candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
@@ -74,14 +74,14 @@ class ConverterBallotToLevelsListNumeric(ConverterBallot):
     def __init__(self, scale: ScaleFromList, borda_unordered_give_points: bool=True):
         self.scale = scale
         self.borda_unordered_give_points = borda_unordered_give_points
+        # noinspection PyTypeChecker
+        self._interval_converter = ConverterBallotToLevelsInterval(
+            scale=ScaleInterval(low=scale.low, high=scale.high),
+            borda_unordered_give_points=borda_unordered_give_points)
 
     def __call__(self, x: object, candidates: set =None) -> BallotLevels:
         if not self.scale.is_numeric:
             raise ValueError('The scale should be numeric.')
-        # noinspection PyTypeChecker
-        x = ConverterBallotToLevelsInterval(
-            scale=ScaleInterval(low=self.scale.low, high=self.scale.high),
-            borda_unordered_give_points=self.borda_unordered_give_points
-        )(x, candidates=None)
+        x = self._interval_converter(x, candidates=None)
         return BallotLevels({c: take_closest(self.scale.levels, v) for c, v in x.items()},
                             candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
@@ -93,11 +93,11 @@ class ConverterBallotToLevelsRange(ConverterBallot):
         self.low = scale.low
         self.high = scale.high
         self.borda_unordered_give_points = borda_unordered_give_points
+        self._interval_converter = ConverterBallotToLevelsInterval(
+            scale=ScaleInterval(low=scale.low, high=scale.high),
+            borda_unordered_give_points=borda_unordered_give_points)
 
     def __call__(self, x: object, candidates: set = None) -> BallotLevels:
-        x = ConverterBallotToLevelsInterval(
-            scale=ScaleInterval(low=self.low, high=self.high),
-            borda_unordered_give_points=self.borda_unordered_give_points
-        )(x, candidates=None)
+        x = self._interval_converter(x, candidates=None)
         return BallotLevels({c: round(v) for c, v in x.items()},
                             candidates=x.candidates, scale=self.scale).restrict(candidates=candidates)
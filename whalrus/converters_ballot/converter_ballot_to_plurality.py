@@ -96,9 +96,10 @@ class ConverterBallotToPlurality(ConverterBallot):
         self.plurality_priority = plurality_priority
         self.veto_priority = veto_priority
         self.one_name_priority = one_name_priority
+        self._general_converter = ConverterBallotGeneral()
 
     def __call__(self, x: object, candidates: set = None) -> BallotPlurality:
-        x = ConverterBallotGeneral()(x, candidates=None)
+        x = self._general_converter(x, candidates=None)
         if isinstance(x, BallotPlurality):
             return x.restrict(candidates=candidates, priority=self.plurality_priority)
         if isinstance(x, BallotVeto):
@@ -115,5 +116,7 @@ class ConverterBallotToPlurality(ConverterBallot):
             x = x.restrict(candidates=candidates)
             return BallotPlurality(x.first(priority=self.order_priority), candidates=x.candidates)
         if isinstance(x, Ballot):
-            x = ConverterBallotGeneral()(x, candidates=candidates)
+            # ``x`` went through the general converter already: only the restriction remains to be done.
+            if candidates is not None:
+                x = x.restrict(candidates)
             return BallotPlurality(x.first(), candidates=x.candidates)
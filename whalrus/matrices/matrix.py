@@ -83,17 +83,36 @@ class Matrix(DeleteCacheMixin):
     def __call__(self, ballots: Union[list, Profile] = None, weights: list = None, voters: list = None,
                  candidates: set = None):
         self.profile_original_ = Profile(ballots, weights=weights, voters=voters)
-        self.profile_converted_ = Profile([self.converter(b, candidates) for b in self.profile_original_],
-                                          weights=self.profile_original_.weights, voters=self.profile_original_.voters)
+        # Convert the ballots and, if needed, accumulate the union of their candidate sets in the same pass.
+        converter = self.converter
         if candidates is None:
-            candidates = NiceSet(set().union(*[b.candidates for b in self.profile_converted_]))
+            converted = []
+            union = set()
+            for b in self.profile_original_:
+                converted_ballot = converter(b, None)
+                converted.append(converted_ballot)
+                union |= converted_ballot.candidates
+            candidates = NiceSet(union)
+        else:
+            converted = [converter(b, candidates) for b in self.profile_original_]
+        self.profile_converted_ = Profile(converted, weights=self.profile_original_.weights,
+                                          voters=self.profile_original_.voters)
         self.candidates_ = candidates
         self._check_profile(candidates)
         self.delete_cache()
         return self
 
     def _check_profile(self, candidates: set) -> None:
-        if any([b.candidates != candidates for b in self.profile_converted_]):
+        """
+        Check that the converted ballots all have the candidates of the election, and warn otherwise.
+
+        ``b.candidates`` is a cached property of the ballot: it is computed at most once per ballot, so reading it
+        here costs one dict lookup only.
+        """
+        # Identity is checked first: converted ballots typically share the election's candidate-set object,
+        # which makes the comparison O(1) instead of a full set equality.
+        if any(b.candidates is not candidates and b.candidates != candidates
+               for b in self.profile_converted_):
             logging.warning('Some ballots do not have the same set of candidates as the whole election.')
 
     @cached_property
@@ -121,10 +140,21 @@ class Matrix(DeleteCacheMixin):
         """Array : The matrix, as a numpy array. Each row and each column corresponds to a candidate (in the order of
         :attr:`candidates_as_list_`).
         """
-        return np.array([[self.as_dict_[(c, d)] for d in self.candidates_as_list_] for c in self.candidates_as_list_])
+        # A flat comprehension avoids building a list of intermediate row lists; dtype inference (e.g. object for
+        # fractions) is the same as with the nested form.
+        candidates = self.candidates_as_list_
+        as_dict = self.as_dict_
+        return np.array([as_dict[(c, d)] for c in candidates for d in candidates]).reshape(
+            (len(candidates), len(candidates)))
 
     @cached_property
     def as_array_of_floats_(self) -> np.array:
         """Array : The matrix, as a numpy array. It is the same as :attr:`as_array_`, but converted to floats.
         """
-        return self.as_array_.astype(float)
+        # np.fromiter fills a preallocated float buffer directly, without going through the object-dtype array
+        # of :attr:`as_array_` (which does not need to be computed at all here).
+        candidates = self.candidates_as_list_
+        as_dict = self.as_dict_
+        n = len(candidates)
+        return np.fromiter((as_dict[(c, d)] for c in candidates for d in candidates),
+                           dtype=float, count=n * n).reshape((n, n))
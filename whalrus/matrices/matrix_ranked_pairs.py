@@ -116,9 +116,10 @@ class MatrixRankedPairs(Matrix):
     def as_array_(self):
         n = len(self.candidates_)
         rp = np.zeros((n, n), dtype=object)
+        indexes = self.matrix_weighted_majority_.candidates_indexes_
         for (c, d) in self.edges_order_:
-            i = self.matrix_weighted_majority_.candidates_indexes_[c]
-            j = self.matrix_weighted_majority_.candidates_indexes_[d]
+            i = indexes[c]
+            j = indexes[d]
             if rp[j, i] > 0:
                 continue
             rp[i, j] = 1
@@ -128,5 +129,7 @@ class MatrixRankedPairs(Matrix):
 
     @cached_property
     def as_dict_(self):
-        return NiceDict({(c, d): self.as_array_[self.candidates_indexes_[c], self.candidates_indexes_[d]]
+        array = self.as_array_
+        indexes = self.candidates_indexes_
+        return NiceDict({(c, d): array[indexes[c], indexes[d]]
                          for c in self.candidates_ for d in self.candidates_})
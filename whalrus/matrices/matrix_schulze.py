@@ -93,5 +93,7 @@ class MatrixSchulze(Matrix):
 
     @cached_property
     def as_dict_(self):
-        return NiceDict({(c, d): self.as_array_[self.candidates_indexes_[c], self.candidates_indexes_[d]]
+        array = self.as_array_
+        indexes = self.candidates_indexes_
+        return NiceDict({(c, d): array[indexes[c], indexes[d]]
                          for c in self.candidates_ for d in self.candidates_})
@@ -166,72 +166,106 @@ class MatrixWeightedMajority(Matrix):
     def _gross_and_weights_(self):
         gross = NiceDict({(c, d): 0 for c in self.candidates_ for d in self.candidates_})
         weights = NiceDict({(c, d): 0 for c in self.candidates_ for d in self.candidates_})
+        # This is the hot kernel of the matrix computation: read the scoring parameters once, instead of once per
+        # pair of candidates. (A compiled kernel is not an option here: the coefficients are exact fractions.)
+        candidates = self.candidates_
+        indifference = self.indifference
+        higher_vs_lower = self.higher_vs_lower
+        lower_vs_higher = self.lower_vs_higher
+        ordered_vs_unordered = self.ordered_vs_unordered
+        unordered_vs_ordered = self.unordered_vs_ordered
+        unordered_vs_unordered = self.unordered_vs_unordered
+        ordered_vs_absent = self.ordered_vs_absent
+        absent_vs_ordered = self.absent_vs_ordered
+        unordered_vs_absent = self.unordered_vs_absent
+        absent_vs_unordered = self.absent_vs_unordered
+        absent_vs_absent = self.absent_vs_absent
+        deal_with_lower = higher_vs_lower is not None or lower_vs_higher is not None
+        deal_with_unordered = ordered_vs_unordered is not None or unordered_vs_ordered is not None
+        deal_with_absent = ordered_vs_absent is not None or absent_vs_ordered is not None
+        deal_with_unordered_block = (unordered_vs_unordered is not None
+                                     or unordered_vs_absent is not None
+                                     or absent_vs_unordered is not None)
         for ballot, weight, _ in self.profile_converted_.items():
-            absent = self.candidates_ - ballot.candidates
-            for i_class, indifference_class in enumerate(ballot.as_weak_order):
-                indifference_class_as_list = list(indifference_class)
+            absent = candidates - ballot.candidates
+            weak_order = ballot.as_weak_order
+            unordered = ballot.candidates_not_in_b
+            # The products below are invariant over the pairwise loops of this ballot.
+            w_indifference = None if indifference is None else weight * indifference
+            w_higher_vs_lower = None if higher_vs_lower is None else weight * higher_vs_lower
+            w_lower_vs_higher = None if lower_vs_higher is None else weight * lower_vs_higher
+            w_ordered_vs_unordered = None if ordered_vs_unordered is None else weight * ordered_vs_unordered
+            w_unordered_vs_ordered = None if unordered_vs_ordered is None else weight * unordered_vs_ordered
+            w_ordered_vs_absent = None if ordered_vs_absent is None else weight * ordered_vs_absent
+            w_absent_vs_ordered = None if absent_vs_ordered is None else weight * absent_vs_ordered
+            # Materialize the indifference classes of this ballot once: the loops below iterate them many times.
+            classes = [list(indifference_class) for indifference_class in weak_order]
+            n_classes = len(classes)
+            for i_class, indifference_class_as_list in enumerate(classes):
                 for i, c in enumerate(indifference_class_as_list):
                     # Deal with other candidates of the indifference class
-                    if self.indifference is not None:
+                    if indifference is not None:
                         for d in indifference_class_as_list[i + 1:]:
-                            gross[(c, d)] += weight * self.indifference
-                            gross[(d, c)] += weight * self.indifference
+                            gross[(c, d)] += w_indifference
+                            gross[(d, c)] += w_indifference
                             weights[(c, d)] += weight
                             weights[(d, c)] += weight
                     # Deal with ordered candidates with lower ranks
-                    if self.higher_vs_lower is not None or self.lower_vs_higher is not None:
-                        for lower_indifference_class in ballot.as_weak_order[i_class + 1:]:
-                            for d in lower_indifference_class:
-                                if self.higher_vs_lower is not None:
-                                    gross[(c, d)] += weight * self.higher_vs_lower
+                    if deal_with_lower:
+                        for j_class in range(i_class + 1, n_classes):
+                            for d in classes[j_class]:
+                                if higher_vs_lower is not None:
+                                    gross[(c, d)] += w_higher_vs_lower
                                     weights[(c, d)] += weight
-                                if self.lower_vs_higher is not None:
-                                    gross[(d, c)] += weight * self.lower_vs_higher
+                                if lower_vs_higher is not None:
+                                    gross[(d, c)] += w_lower_vs_higher
                                     weights[(d, c)] += weight
                     # Deal with unordered candidates
-                    if self.ordered_vs_unordered is not None or self.unordered_vs_ordered is not None:
-                        for d in ballot.candidates_not_in_b:
-                            if self.ordered_vs_unordered is not None:
-                                gross[(c, d)] += weight * self.ordered_vs_unordered
+                    if deal_with_unordered:
+                        for d in unordered:
+                            if ordered_vs_unordered is not None:
+                                gross[(c, d)] += w_ordered_vs_unordered
                                 weights[(c, d)] += weight
-                            if self.unordered_vs_ordered is not None:
-                                gross[(d, c)] += weight * self.unordered_vs_ordered
+                            if unordered_vs_ordered is not None:
+                                gross[(d, c)] += w_unordered_vs_ordered
                                 weights[(d, c)] += weight
                     # Deal with absent candidates
-                    if self.ordered_vs_absent is not None or self.absent_vs_ordered is not None:
+                    if deal_with_absent:
                         for d in absent:
-                            if self.ordered_vs_absent is not None:
-                                gross[(c, d)] += weight * self.ordered_vs_absent
+                            if ordered_vs_absent is not None:
+                                gross[(c, d)] += w_ordered_vs_absent
                                 weights[(c, d)] += weight
-                            if self.absent_vs_ordered is not None:
-                                gross[(d, c)] += weight * self.absent_vs_ordered
+                            if absent_vs_ordered is not None:
+                                gross[(d, c)] += w_absent_vs_ordered
                                 weights[(d, c)] += weight
-            if (self.unordered_vs_unordered is not None
-                    or self.unordered_vs_absent is not None
-                    or self.absent_vs_unordered is not None):
-                unordered_as_list = list(ballot.candidates_not_in_b)
+            if deal_with_unordered_block:
+                unordered_as_list = list(unordered)
+                w_unordered_vs_unordered = None if unordered_vs_unordered is None else weight * unordered_vs_unordered
+                w_unordered_vs_absent = None if unordered_vs_absent is None else weight * unordered_vs_absent
+                w_absent_vs_unordered = None if absent_vs_unordered is None else weight * absent_vs_unordered
                 for i, c in enumerate(unordered_as_list):
                     # Deal with other unordered candidates
-                    if self.unordered_vs_unordered is not None:
+                    if unordered_vs_unordered is not None:
                         for d in unordered_as_list[i + 1:]:
-                            gross[(c, d)] += weight * self.unordered_vs_unordered
-                            gross[(d, c)] += weight * self.unordered_vs_unordered
+                            gross[(c, d)] += w_unordered_vs_unordered
+                            gross[(d, c)] += w_unordered_vs_unordered
                             weights[(c, d)] += weight
                             weights[(d, c)] += weight
                     # Deal with absent candidates
                     for d in absent:
-                        if self.unordered_vs_absent is not None:
-                            gross[(c, d)] += weight * self.unordered_vs_absent
+                        if unordered_vs_absent is not None:
+                            gross[(c, d)] += w_unordered_vs_absent
                             weights[(c, d)] += weight
-                        if self.absent_vs_unordered is not None:
-                            gross[(d, c)] += weight * self.absent_vs_unordered
+                        if absent_vs_unordered is not None:
+                            gross[(d, c)] += w_absent_vs_unordered
                             weights[(d, c)] += weight
-            if self.absent_vs_absent is not None:
+            if absent_vs_absent is not None:
+                w_absent_vs_absent = weight * absent_vs_absent
                 absent_as_list = list(absent)
                 for i, c in enumerate(absent_as_list):
                     for d in absent_as_list[i + 1:]:
-                        gross[(c, d)] += weight * self.absent_vs_absent
-                        gross[(d, c)] += weight * self.absent_vs_absent
+                        gross[(c, d)] += w_absent_vs_absent
+                        gross[(d, c)] += w_absent_vs_absent
                         weights[(c, d)] += weight
                         weights[(d, c)] += weight
         return {'gross': gross, 'weights': weights}
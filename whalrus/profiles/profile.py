@@ -26,6 +26,10 @@ from typing import Union, Iterator
 from numbers import Number
 
 
+# Default converter, shared by all profiles: it is stateless, so there is no point in building one per call.
+_general_converter = ConverterBallotGeneral()
+
+
 class Profile(DeleteCacheMixin):
     """
     A profile of ballots.
@@ -101,9 +105,10 @@ class Profile(DeleteCacheMixin):
         (3): b > a
     """
 
+    __slots__ = ('_ballots', '_weights', '_voters', '_cached_properties')
+
     def __init__(self, ballots: Union[list, 'Profile'], weights: list = None, voters: list = None):
-        converter = ConverterBallotGeneral()
-        self._ballots = [converter(b) for b in ballots]
+        self._ballots = [_general_converter(b) for b in ballots]
         if weights is None:
             if isinstance(ballots, Profile):
                 weights = ballots.weights
@@ -224,7 +229,7 @@ class Profile(DeleteCacheMixin):
             a > b
             b > a
         """
-        self._ballots.append(ConverterBallotGeneral()(ballot))
+        self._ballots.append(_general_converter(ballot))
         self._weights.append(convert_number(weight))
         self._voters.append(voter)
         self.delete_cache()
@@ -253,11 +258,13 @@ class Profile(DeleteCacheMixin):
         """
         if ballot is None:
             i = next(i for i, v in enumerate(self.voters) if v == voter)
-        elif voter is None:
-            i = next(i for i, b in enumerate(self.ballots) if b == ConverterBallotGeneral()(ballot))
         else:
-            i = next(i for i, b in enumerate(self.ballots)
-                     if b == ConverterBallotGeneral()(ballot) and self.voters[i] == voter)
+            converted = _general_converter(ballot)
+            if voter is None:
+                i = next(i for i, b in enumerate(self.ballots) if b == converted)
+            else:
+                i = next(i for i, b in enumerate(self.ballots)
+                         if b == converted and self.voters[i] == voter)
         del self._ballots[i]
         del self._voters[i]
         del self._weights[i]
@@ -313,7 +320,7 @@ class Profile(DeleteCacheMixin):
             a ~ b
             b > a
         """
-        self._ballots[key] = ConverterBallotGeneral()(value)
+        self._ballots[key] = _general_converter(value)
         self.delete_cache()
 
     def __delitem__(self, key: int) -> None:
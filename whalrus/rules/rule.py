@@ -89,17 +89,35 @@ class Rule(DeleteCacheMixin):
     def __call__(self, ballots: Union[list, Profile] = None, weights: list = None, voters: list = None,
                  candidates: set = None):
         self.profile_original_ = Profile(ballots, weights=weights, voters=voters)
-        self.profile_converted_ = Profile([self.converter(b, candidates) for b in self.profile_original_],
-                                          weights=self.profile_original_.weights, voters=self.profile_original_.voters)
+        # Convert the ballots and, if needed, accumulate the union of their candidate sets in the same pass.
+        converter = self.converter
         if candidates is None:
-            candidates = set().union(*[b.candidates for b in self.profile_converted_])
+            converted = []
+            candidates = set()
+            for b in self.profile_original_:
+                converted_ballot = converter(b, None)
+                converted.append(converted_ballot)
+                candidates |= converted_ballot.candidates
+        else:
+            converted = [converter(b, candidates) for b in self.profile_original_]
+        self.profile_converted_ = Profile(converted, weights=self.profile_original_.weights,
+                                          voters=self.profile_original_.voters)
         self.candidates_ = NiceSet(candidates)
         self._check_profile(candidates)
         self.delete_cache()
         return self
 
     def _check_profile(self, candidates: set) -> None:
-        if any([b.candidates != candidates for b in self.profile_converted_]):
+        """
+        Check that the converted ballots all have the candidates of the election, and warn otherwise.
+
+        ``b.candidates`` is a cached property of the ballot: it is computed at most once per ballot, so reading it
+        here costs one dict lookup only.
+        """
+        # Identity is checked first: converted ballots typically share the election's candidate-set object,
+        # which makes the comparison O(1) instead of a full set equality.
+        if any(b.candidates is not candidates and b.candidates != candidates
+               for b in self.profile_converted_):
             logging.warning('Some ballots do not have the same set of candidates as the whole election.')
 
     @cached_property
@@ -28,6 +28,46 @@ from whalrus.utils.utils import cached_property, NiceDict, my_division
 from whalrus.converters_ballot.converter_ballot import ConverterBallot
 
 
+def _median_p_q(levels, weights, scale: Scale) -> tuple:
+    """
+    Auxiliary function for :attr:`RuleMajorityJudgment.scores_`.
+
+    Returns the tuple ``(median, p, q, total_weight)`` for one candidate: its (lower) median level, the total weight
+    of the voters who evaluate it strictly better (resp. worse) than its median, and the total weight.
+    """
+    # Walk the sort indexes directly instead of building permuted copies of both lists. A single pass in sorted
+    # order gives everything at once: the median is the level at the crossing of half the total weight, ``q`` is
+    # the cumulative weight strictly before the median run, and ``p`` is the total weight strictly after it.
+    indexes = scale.argsort(levels)
+    # Bind the comparators once: they are called for (almost) every level in the loop below.
+    lt = scale.lt
+    gt = scale.gt
+    total_weight = sum(weights)
+    half_total_weight = my_division(total_weight, 2)
+    cumulative_weight = 0
+    median = None
+    weight_before_run = 0
+    previous_level = None
+    q = 0
+    for i in indexes:
+        level = levels[i]
+        if median is None:
+            if previous_level is None or lt(previous_level, level):
+                # A new run of equal levels begins here.
+                weight_before_run = cumulative_weight
+                previous_level = level
+            cumulative_weight += weights[i]
+            if cumulative_weight >= half_total_weight:
+                median = level
+                q = weight_before_run
+        else:
+            if gt(level, median):
+                break
+            cumulative_weight += weights[i]
+    p = total_weight - cumulative_weight
+    return median, p, q, total_weight
+
+
 class RuleMajorityJudgment(RuleScore):
     """
     Majority Judgment.
@@ -101,31 +141,34 @@ class RuleMajorityJudgment(RuleScore):
     def scores_(self) -> NiceDict:
         """NiceDict: The scores. A :class:`NiceDict` of triples.
         """
-        levels_ = NiceDict({c: [] for c in self.candidates_})
-        weights_ = NiceDict({c: [] for c in self.candidates_})
+        scorer = self.scorer
+        scale = scorer.scale
+        candidates = self.candidates_
+        # One dict of (level, weight) pairs per candidate: the inner loop below then does a single hash lookup and
+        # a single append per score, instead of one of each for the levels and for the weights.
+        pairs_ = {c: [] for c in candidates}
+        # When the same ballot object appears several times with an anonymous voter, score it only once. The cache
+        # is keyed by id: ballots are not hashable, and the profile keeps them alive for the whole loop, so the ids
+        # are stable here. Ballots cast with an explicit voter are always rescored, in case the scorer uses it.
+        cache = {}
         for ballot, weight, voter in self.profile_converted_.items():
-            for c, level in self.scorer(ballot=ballot, voter=voter, candidates=self.candidates_).scores_.items():
-                levels_[c].append(level)
-                weights_[c].append(weight)
+            if voter is None:
+                ballot_scores = cache.get(id(ballot))
+                if ballot_scores is None:
+                    ballot_scores = scorer(ballot=ballot, voter=None, candidates=candidates).scores_
+                    cache[id(ballot)] = ballot_scores
+            else:
+                ballot_scores = scorer(ballot=ballot, voter=voter, candidates=candidates).scores_
+            for c, level in ballot_scores.items():
+                pairs_[c].append((level, weight))
         scores_ = NiceDict()
-        for c in self.candidates_:
-            if not levels_[c]:
+        for c in candidates:
+            pairs = pairs_[c]
+            if not pairs:
                 scores_[c] = (self.default_median, 0, 0)
                 continue
-            indexes = self.scorer.scale.argsort(levels_[c])
-            levels_[c] = [levels_[c][i] for i in indexes]
-            weights_[c] = [weights_[c][i] for i in indexes]
-            total_weight = sum(weights_[c])
-            half_total_weight = my_division(total_weight, 2)
-            cumulative_weight = 0
-            median = None
-            for i, weight in enumerate(weights_[c]):
-                cumulative_weight += weight
-                if cumulative_weight >= half_total_weight:
-                    median = levels_[c][i]
-                    break
-            p = sum([weights_[c][i] for i, level in enumerate(levels_[c]) if self.scorer.scale.gt(level, median)])
-            q = sum([weights_[c][i] for i, level in enumerate(levels_[c]) if self.scorer.scale.lt(level, median)])
+            levels, weights = zip(*pairs)
+            median, p, q, total_weight = _median_p_q(levels, weights, scale)
             if p > q:
                 scores_[c] = (median, my_division(p, total_weight), -my_division(q, total_weight))
             else:
@@ -133,13 +176,18 @@ class RuleMajorityJudgment(RuleScore):
         return scores_
 
     def compare_scores(self, one: tuple, another: tuple) -> int:
-        if one == another:
-            return 0
-        if self.scorer.scale.lt(one[0], another[0]):
+        # Compare the medians first: the former upfront equality test on the full tuples compared the medians
+        # anyway, so it was pure extra work whenever the scores differed.
+        scale = self.scorer.scale
+        if scale.lt(one[0], another[0]):
             return -1
-        if self.scorer.scale.gt(one[0], another[0]):
+        if scale.gt(one[0], another[0]):
             return 1
-        return -1 if (one[1], one[2]) < (another[1], another[2]) else 1
+        one_tail = (one[1], one[2])
+        another_tail = (another[1], another[2])
+        if one_tail == another_tail:
+            return 0
+        return -1 if one_tail < another_tail else 1
 
     @cached_property
     def scores_as_floats_(self) -> NiceDict:
@@ -74,7 +74,11 @@ class RuleSimplifiedDodgson(RuleScoreNum):
 
     @cached_property
     def scores_(self) -> NiceDict:
+        # One pass over the matrix accumulates all the row sums at once, instead of scanning the whole dictionary
+        # again for each candidate.
         matrix = self.matrix_weighted_majority_
-        return NiceDict({
-            c: convert_number(sum([v for (i, j), v in matrix.as_dict_.items() if i == c and j != c and v < 0]))
-            for c in matrix.candidates_})
+        scores = {c: 0 for c in matrix.candidates_}
+        for (i, j), v in matrix.as_dict_.items():
+            if i != j and v < 0:
+                scores[i] += v
+        return NiceDict({c: convert_number(score) for c, score in scores.items()})
@@ -112,4 +112,5 @@ class ScaleInterval(Scale):
             >>> ScaleInterval(low=0, high=1).argsort([.3, .1, .7])
             [1, 0, 2]
         """
-        return sorted(range(len(some_list)), key=lambda i: some_list[i], reverse=reverse)
+        # list.__getitem__ is a C slot, so it is noticeably cheaper as a sort key than an equivalent lambda.
+        return sorted(range(len(some_list)), key=some_list.__getitem__, reverse=reverse)
@@ -18,12 +18,34 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with Whalrus.  If not, see <http://www.gnu.org/licenses/>.
 """
+from functools import lru_cache
 from whalrus.ballots.ballot_order import BallotOrder
 from whalrus.utils.utils import cached_property, NiceDict, my_division
 from whalrus.scorers.scorer import Scorer
 from typing import Union
 
 
+@lru_cache(maxsize=256)
+def _bucklin_tier_values(k: int, sizes: tuple) -> tuple:
+    """
+    Auxiliary function for :attr:`ScorerBucklin.scores_`: the value received by each tier of candidates.
+
+    ``sizes`` are the sizes of the successive tiers (indifference classes, then possibly the unordered and the
+    absent candidates). The result depends only on ``k`` and on these sizes, not on the candidates themselves, so
+    it is memoized: across a profile, many ballots share the same shape.
+    """
+    values = []
+    points_remaining = k
+    for size in sizes:
+        if size <= points_remaining:
+            points_remaining -= size
+            values.append(1)
+        else:
+            values.append(my_division(points_remaining, size))
+            points_remaining = 0
+    return tuple(values)
+
+
 class ScorerBucklin(Scorer):
     """
     Scorer for Bucklin's rule.
@@ -90,37 +112,26 @@ class ScorerBucklin(Scorer):
 
     @cached_property
     def scores_(self) -> NiceDict:
+        # The tiers are the indifference classes, then (depending on the options) the unordered and the absent
+        # candidates. The value received by each tier depends only on ``k`` and on the tier sizes, so it is
+        # delegated to the memoized :func:`_bucklin_tier_values`; only the candidate assignment runs per ballot.
+        ballot = self.ballot_
+        tiers = list(ballot.as_weak_order)
+        zero_tiers = []
+        if self.unordered_receive_points is True:
+            tiers.append(ballot.candidates_not_in_b)
+        elif self.unordered_receive_points is False:
+            zero_tiers.append(ballot.candidates_not_in_b)
+        if self.absent_receive_points is True:
+            tiers.append(self.candidates_ - ballot.candidates)
+        elif self.absent_receive_points is False:
+            zero_tiers.append(self.candidates_ - ballot.candidates)
+        values = _bucklin_tier_values(self.k, tuple(len(tier) for tier in tiers))
         scores = NiceDict()
-        points_remaining = self.k
-        # Ordered candidates
-        for indifference_class in self.ballot_.as_weak_order[:]:
-            n_indifference = len(indifference_class)
-            if n_indifference <= points_remaining:
-                scores.update({c: 1 for c in indifference_class})
-                points_remaining -= n_indifference
-            else:
-                scores.update({c: my_division(points_remaining, n_indifference) for c in indifference_class})
-                points_remaining = 0
-        # Unordered candidates
-        if self.unordered_receive_points is False:
-            scores.update({c: 0 for c in self.ballot_.candidates_not_in_b})
-        elif self.unordered_receive_points is True:
-            unordered = self.ballot_.candidates_not_in_b
-            n_unordered = len(unordered)
-            if n_unordered <= points_remaining:
-                scores.update({c: 1 for c in unordered})
-                points_remaining -= n_unordered
-            else:
-                scores.update({c: my_division(points_remaining, n_unordered) for c in unordered})
-                points_remaining = 0
-        # Absent candidates
-        if self.absent_receive_points is False:
-            scores.update({c: 0 for c in self.candidates_ - self.ballot_.candidates})
-        elif self.absent_receive_points is True:
-            absent = self.candidates_ - self.ballot_.candidates
-            n_absent = len(absent)
-            if n_absent <= points_remaining:
-                scores.update({c: 1 for c in absent})
-            else:
-                scores.update({c: my_division(points_remaining, n_absent) for c in absent})
+        for tier, value in zip(tiers, values):
+            for c in tier:
+                scores[c] = value
+        for tier in zero_tiers:
+            for c in tier:
+                scores[c] = 0
         return scores
@@ -3,6 +3,7 @@ from pyparsing import Group, Word, ZeroOrMore, alphas, nums, ParseException
 from bisect import bisect_left
 from fractions import Fraction
 from decimal import Decimal
+from functools import lru_cache
 from numbers import Number
 
 
@@ -77,11 +78,37 @@ class DeleteCacheMixin:
         42
     """
 
+    __slots__ = ()
+
     # noinspection PyAttributeOutsideInit
     def delete_cache(self) -> None:
         self._cached_properties = dict()
 
 
+# Parser for weak orders, built once at import: the grammar never changes.
+_wo_candidate = Word(alphas.upper() + alphas.lower() + nums + '_')
+_wo_equiv_class = Group(_wo_candidate + ZeroOrMore(Word('~').suppress() + _wo_candidate))
+_wo_weak_preference = _wo_equiv_class + ZeroOrMore(Word('>').suppress() + _wo_equiv_class)
+_wo_empty_preference = ZeroOrMore(' ')
+
+
+@lru_cache(maxsize=1024)
+def _parse_weak_order_groups(s: str) -> tuple:
+    """
+    Auxiliary function for :func:`parse_weak_order`: the indifference classes of ``s``, as a tuple of tuples.
+
+    The result is immutable, so it can safely be memoized: in a typical profile, many voters emit the same ballot
+    string, and the pyparsing work is by far the dominant cost of converting it.
+    """
+    # if s = 'Jean ~ Titi ~ tata32 > me > you ~ us > them', then
+    # parsed = [['Jean', 'Titi', 'tata32'], ['me'], ['you', 'us'], ['them']]
+    try:
+        parsed = _wo_empty_preference.parseString(s, parseAll=True).asList()
+    except ParseException:
+        parsed = _wo_weak_preference.parseString(s, parseAll=True).asList()
+    return tuple(tuple(group) for group in parsed)
+
+
 def parse_weak_order(s: str) -> list:
     """
     Convert a string representing a weak order to a list of sets.
@@ -102,22 +129,9 @@ def parse_weak_order(s: str) -> list:
         >>> parse_weak_order(s) == [{'Alice', 'Bob', 'Catherine32'}, {'me'}, {'you', 'us'}, {'them'}]
         True
     """
-
-    # Build the parser
-    candidate = Word(alphas.upper() + alphas.lower() + nums + '_')
-    equiv_class = Group(candidate + ZeroOrMore(Word('~').suppress() + candidate))
-    weak_preference = equiv_class + ZeroOrMore(Word('>').suppress() + equiv_class)
-    empty_preference = ZeroOrMore(' ')
-
-    # if s = 'Jean ~ Titi ~ tata32 > me > you ~ us > them', then
-    # parsed = [['Jean', 'Titi', 'tata32'], ['me'], ['you', 'us'], ['them']]
-    try:
-        parsed = empty_preference.parseString(s, parseAll=True).asList()
-    except ParseException:
-        parsed = weak_preference.parseString(s, parseAll=True).asList()
-
-    # Final conversion to format [{'Jean', 'tata32', 'Titi'}, {'me'}, {'us', 'you'}, {'them'}]
-    return [NiceSet(s) for s in parsed]
+    # Final conversion to format [{'Jean', 'tata32', 'Titi'}, {'me'}, {'us', 'you'}, {'them'}].
+    # Fresh sets are built on each call, so callers may mutate the result freely.
+    return [NiceSet(group) for group in _parse_weak_order_groups(s)]
 
 
 def set_to_list(s: set) -> list:
@@ -138,10 +152,22 @@ def set_to_list(s: set) -> list:
         >>> set_to_list({2, 42, 12})
         [2, 12, 42]
     """
+    # A fresh copy is returned on each call, so callers may mutate the result freely.
+    return list(_set_to_tuple_cached(frozenset(s)))
+
+
+@lru_cache(maxsize=256)
+def _set_to_tuple_cached(s: frozenset) -> tuple:
+    """
+    Auxiliary function for :func:`set_to_list`: the elements of ``s``, sorted if they are comparable.
+
+    The result is immutable, so it can safely be memoized: the same candidate set is typically sorted over and over
+    across the rules, matrices and scorers of an election.
+    """
     try:
-        return sorted(s)
+        return tuple(sorted(s))
     except TypeError:
-        return list(s)
+        return tuple(s)
 
 
 def set_to_str(s: set) -> str:
@@ -305,6 +331,14 @@ def convert_number(x: Number):
         >>> convert_number(2.0)
         2
     """
+    # Fast paths: integers and fractions are by far the most common inputs (every ballot level goes through here),
+    # and they need no conversion at all.
+    if type(x) is int:
+        return x
+    if type(x) is Fraction:
+        if x.denominator == 1:
+            return x.numerator
+        return x
     if isinstance(x, float):
         x = str(x)
     try: